@@ -31,6 +31,34 @@ except ImportError as e:
     GITHUB_AVAILABLE = False
     ProjectOwnerCommunication = None
 
+# Feature analysis prompt; only the issue title and description vary per call
+FEATURE_ANALYSIS_PROMPT_TEMPLATE = """
+        Analyze this feature request for DigiNativa (Swedish public sector digitalization game).
+
+        TITLE: {title}
+        DESCRIPTION: {description}
+
+        Consider:
+        - Educational value for public sector professionals
+        - Time constraints (<10 minute sessions)
+        - Technical feasibility with React + FastAPI
+        - Alignment with professional learning goals
+
+        Return ONLY valid JSON:
+        {{
+            "recommendation": {{
+                "action": "approve|reject|clarify",
+                "reasoning": "Brief explanation",
+                "priority": "high|medium|low"
+            }},
+            "complexity": {{
+                "estimated_days": 3-7,
+                "estimated_stories": 2-5
+            }},
+            "technical_notes": ["React component needed", "API endpoint required"]
+        }}
+        """
+
 class ProjektledareAgent:
     """
     Simplified Projektledare agent for DigiNativa AI team.
@@ -133,35 +161,10 @@ class ProjektledareAgent:
     
     async def _analyze_with_claude(self, title: str, description: str) -> Dict[str, Any]:
         """Analyze feature using Claude."""
-        prompt = f"""
-        Analyze this feature request for DigiNativa (Swedish public sector digitalization game).
-
-        TITLE: {title}
-        DESCRIPTION: {description}
-
-        Consider:
-        - Educational value for public sector professionals
-        - Time constraints (<10 minute sessions)
-        - Technical feasibility with React + FastAPI
-        - Alignment with professional learning goals
-
-        Return ONLY valid JSON:
-        {{
-            "recommendation": {{
-                "action": "approve|reject|clarify",
-                "reasoning": "Brief explanation",
-                "priority": "high|medium|low"
-            }},
-            "complexity": {{
-                "estimated_days": 3-7,
-                "estimated_stories": 2-5
-            }},
-            "technical_notes": ["React component needed", "API endpoint required"]
-        }}
-        """
+        prompt = FEATURE_ANALYSIS_PROMPT_TEMPLATE.format(title=title, description=description)
         
         try:
-            response = self.claude_llm.invoke(prompt)
+            response = await self.claude_llm.ainvoke(prompt)
             return json.loads(response.content)
         except Exception as e:
             print(f"⚠️  Claude analysis failed: {e}")
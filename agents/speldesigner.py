@@ -20,6 +20,7 @@ SIMPLIFIED ARCHITECTURE:
 """
 
 import json
+import re
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
@@ -36,6 +37,66 @@ from tools.file_utils import read_file, write_file, save_spec_file
 from workflows.status_handler import StatusHandler
 
 
+# Acceptance criteria section and its checkbox items, compiled once at import
+CRITERIA_SECTION_RE = re.compile(
+    r'## Acceptance Criteria\s*\n(.*?)(?=\n##|\n---|\Z)',
+    re.DOTALL | re.IGNORECASE
+)
+CRITERIA_CHECKBOX_RE = re.compile(r'- \[ \] (.+)')
+
+# Static part of the specification prompt; formatted once per agent with the DNA documents
+SPEC_SYSTEM_PROMPT_TEMPLATE = """
+        You create comprehensive UX specifications for DigiNativa features.
+
+        DESIGN CONTEXT:
+        {design_principles}
+
+        TARGET USER:
+        {target_audience}
+
+        Create a detailed UX specification in markdown format that includes:
+
+        1. FEATURE OVERVIEW
+        - Clear description of what this feature does
+        - User value proposition for Anna
+
+        2. USER EXPERIENCE FLOW
+        - Step-by-step interaction flow
+        - Entry and exit points
+        - Key decision points
+
+        3. VISUAL DESIGN REQUIREMENTS
+        - Professional Swedish institutional design
+        - Color scheme and typography guidelines
+        - Layout principles and responsive requirements
+
+        4. INTERACTION DESIGN
+        - User interface elements needed
+        - Feedback and loading states
+        - Error handling approaches
+
+        5. ACCESSIBILITY REQUIREMENTS
+        - WCAG compliance requirements
+        - Keyboard navigation
+        - Screen reader compatibility
+
+        6. TECHNICAL CONSTRAINTS
+        - Performance requirements (<2 second load time)
+        - Mobile responsiveness requirements
+        - Browser compatibility needs
+
+        7. ACCEPTANCE CRITERIA
+        Generate 8-10 specific, testable criteria such as:
+        - Interface loads within 2 seconds
+        - All interactive elements have 44px minimum touch targets
+        - Design maintains readability at 150% zoom
+        - Error states provide clear guidance to user
+
+        Focus on Anna's needs: professional, time-efficient, pedagogically valuable.
+        Ensure the design serves the learning goals about digitalization strategy.
+        """
+
+
 class SpeldesignerAgent:
     """
     Simplified Speldesigner agent for DigiNativa AI team.
@@ -53,6 +114,7 @@ class SpeldesignerAgent:
         # Cache for design principles and target audience
         self._design_principles = None
         self._target_audience = None
+        self._system_prompt = None
         
         print(f"✅ Speldesigner ready")
         print(f"   Claude available: {self.claude_llm is not None}")
@@ -115,6 +177,15 @@ class SpeldesignerAgent:
                 """
         return self._target_audience
     
+    def get_system_prompt(self) -> str:
+        """Get the specification system prompt with DNA context (built once)."""
+        if self._system_prompt is None:
+            self._system_prompt = SPEC_SYSTEM_PROMPT_TEMPLATE.format(
+                design_principles=self.get_design_principles(),
+                target_audience=self.get_target_audience()
+            )
+        return self._system_prompt
+    
     async def create_ux_specification(self, feature_request: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create UX specification from feature request.
@@ -187,65 +258,14 @@ class SpeldesignerAgent:
     
     async def _generate_specification_with_claude(self, title: str, description: str) -> str:
         """Generate UX specification using Claude."""
-        design_principles = self.get_design_principles()
-        target_audience = self.get_target_audience()
-        
-        prompt = f"""
-        Create a comprehensive UX specification for this DigiNativa feature.
-
-        FEATURE TITLE: {title}
-        FEATURE DESCRIPTION: {description}
-
-        DESIGN CONTEXT:
-        {design_principles}
-
-        TARGET USER:
-        {target_audience}
-
-        Create a detailed UX specification in markdown format that includes:
-
-        1. FEATURE OVERVIEW
-        - Clear description of what this feature does
-        - User value proposition for Anna
-
-        2. USER EXPERIENCE FLOW
-        - Step-by-step interaction flow
-        - Entry and exit points
-        - Key decision points
-
-        3. VISUAL DESIGN REQUIREMENTS
-        - Professional Swedish institutional design
-        - Color scheme and typography guidelines
-        - Layout principles and responsive requirements
-
-        4. INTERACTION DESIGN
-        - User interface elements needed
-        - Feedback and loading states
-        - Error handling approaches
-
-        5. ACCESSIBILITY REQUIREMENTS
-        - WCAG compliance requirements
-        - Keyboard navigation
-        - Screen reader compatibility
-
-        6. TECHNICAL CONSTRAINTS
-        - Performance requirements (<2 second load time)
-        - Mobile responsiveness requirements
-        - Browser compatibility needs
-
-        7. ACCEPTANCE CRITERIA
-        Generate 8-10 specific, testable criteria such as:
-        - Interface loads within 2 seconds
-        - All interactive elements have 44px minimum touch targets
-        - Design maintains readability at 150% zoom
-        - Error states provide clear guidance to user
-
-        Focus on Anna's needs: professional, time-efficient, pedagogically valuable.
-        Ensure the design serves the learning goals about digitalization strategy.
-        """
+        # Static context is sent as the system message; only the feature varies per call
+        messages = [
+            ("system", self.get_system_prompt()),
+            ("human", f"FEATURE TITLE: {title}\nFEATURE DESCRIPTION: {description}"),
+        ]
         
         try:
-            response = self.claude_llm.invoke(prompt)
+            response = self.claude_llm.invoke(messages)
             return response.content
         except Exception as e:
             print(f"⚠️  Claude generation failed: {e}")
@@ -323,17 +343,12 @@ class SpeldesignerAgent:
         criteria = []
         
         # Look for acceptance criteria section
-        import re
-        criteria_match = re.search(
-            r'## Acceptance Criteria\s*\n(.*?)(?=\n##|\n---|\Z)', 
-            spec_content, 
-            re.DOTALL | re.IGNORECASE
-        )
+        criteria_match = CRITERIA_SECTION_RE.search(spec_content)
         
         if criteria_match:
             criteria_text = criteria_match.group(1)
             # Extract checkboxes
-            criteria_lines = re.findall(r'- \[ \] (.+)', criteria_text)
+            criteria_lines = CRITERIA_CHECKBOX_RE.findall(criteria_text)
             criteria.extend(criteria_lines)
         
         # If no criteria found, create basic ones
@@ -37,6 +37,9 @@ from config.settings import SECRETS, TECH_STACK
 from tools.file_utils import read_file, write_file, read_spec_file
 from workflows.status_handler import StatusHandler
 
+# Fenced code block in Claude's output (language tag optional), compiled once at import
+CODE_BLOCK_RE = re.compile(r'```(?:python|typescript|tsx|javascript)?\n(.*?)```', re.DOTALL)
+
 
 class UtvecklareAgent:
     """
@@ -564,7 +567,7 @@ export default {component_name};
         """Clean and format generated code."""
         # Remove markdown code blocks if present
         if "```" in code:
-            code_blocks = re.findall(r'```(?:python|typescript|tsx|javascript)?\n(.*?)```', code, re.DOTALL)
+            code_blocks = CODE_BLOCK_RE.findall(code)
             if code_blocks:
                 code = code_blocks[0]
         
@@ -61,12 +61,14 @@ async def test_real_workflow():
         for i, processed_feature in enumerate(feature_requests):
             feature_request = processed_feature['request']
             analysis = processed_feature['analysis']
+            recommendation = analysis.get('recommendation') or {}
+            action = recommendation.get('action', 'unknown')
             
             print_step(f"Step 3.{i+1}: Processing Feature #{feature_request['number']}")
             print_info(f"Title: {feature_request['title']}")
-            print_info(f"Action: {analysis.get('recommendation', {}).get('action', 'unknown')}")
+            print_info(f"Action: {action}")
             
-            if analysis.get('recommendation', {}).get('action') == 'approve':
+            if action == 'approve':
                 print_success("Feature approved by AI analysis!")
                 
                 # Step 4: Verify story breakdown was created
@@ -133,8 +135,7 @@ async def test_real_workflow():
                 
                 return True
             else:
-                action = analysis.get('recommendation', {}).get('action', 'unknown')
-                reasoning = analysis.get('recommendation', {}).get('reasoning', 'No reasoning provided')
+                reasoning = recommendation.get('reasoning', 'No reasoning provided')
                 print_info(f"Feature not approved: {action}")
                 print_info(f"Reasoning: {reasoning}")
         
@@ -0,0 +1,81 @@
+"""
+Test-suite wide options, markers and shared agent fixtures.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the project packages importable for every test module. The root
+# conftest is imported before any test module is collected, so this runs once.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-llm",
+        action="store_true",
+        default=False,
+        help="skip tests marked 'llm' (real agent/LLM calls) for a fast inner loop",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--no-llm"):
+        return
+    skip_llm = pytest.mark.skip(reason="real LLM tests disabled with --no-llm")
+    for item in items:
+        if "llm" in item.keywords:
+            item.add_marker(skip_llm)
+
+
+@pytest.fixture
+def mem_fs(monkeypatch):
+    """
+    Route tools.file_utils reads/writes to an in-memory backend for one test.
+    Returns the backend, so tests can seed or inspect its files.
+    """
+    from tools import file_utils
+    fs = file_utils.InMemoryFileSystem()
+    monkeypatch.setattr(file_utils, "_FS", fs)
+    return fs
+
+
+@pytest.fixture(scope="session")
+def canned_feature_analysis():
+    """Deterministic Projektledare feature analysis, for tests that must not call Claude."""
+    return {
+        "recommendation": {
+            "action": "approve",
+            "reasoning": "Clear educational value for Anna",
+            "priority": "medium"
+        },
+        "complexity": {"estimated_days": 3, "estimated_stories": 2},
+        "technical_notes": ["React component needed", "API endpoint required"]
+    }
+
+
+# Agents are expensive to build (LLM client, tools, config), so each one is
+# created once per session. The imports are local so that suites which never
+# use an agent do not pay for CrewAI/LangChain.
+
+@pytest.fixture(scope="session")
+def projektledare():
+    """Shared Projektledare agent."""
+    from agents.projektledare import create_projektledare
+    return create_projektledare()
+
+
+@pytest.fixture(scope="session")
+def speldesigner():
+    """Shared Speldesigner agent."""
+    from agents.speldesigner import create_speldesigner_agent
+    return create_speldesigner_agent()
+
+
+@pytest.fixture(scope="session")
+def utvecklare():
+    """Shared Utvecklare agent."""
+    from agents.utvecklare import create_utvecklare_agent
+    return create_utvecklare_agent()
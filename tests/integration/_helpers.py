@@ -0,0 +1,62 @@
+"""
+Shared helpers for the integration test scripts.
+
+Progress output goes through the logging module. Under pytest it is
+captured with the test's logs (shown live with -o log_cli=true
+--log-cli-level=INFO); scripts run directly call logging.basicConfig.
+Keeping the helpers here gives every suite the same format and one
+definition per process instead of a copy per test module.
+"""
+
+import logging
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock, patch
+
+logger = logging.getLogger(__name__)
+
+_SEPARATOR = "=" * 70
+
+def print_section(title: str):
+    """Log clear test section headers (one record instead of three)."""
+    logger.info("\n%s\n🧪 %s\n%s", _SEPARATOR, title, _SEPARATOR)
+
+def print_success(message: str):
+    """Log success message."""
+    logger.info("✅ %s", message)
+
+def print_info(message: str):
+    """Log info message."""
+    logger.info("ℹ️  %s", message)
+
+def print_error(message: str):
+    """Log error message."""
+    logger.error("❌ %s", message)
+
+def print_warning(message: str):
+    """Log warning message."""
+    logger.warning("⚠️  %s", message)
+
+# Agent modules whose create_<name>_agent factory mocked_agent_factories() replaces.
+# Only agents that exist in agents/ are listed; patching a missing module fails.
+AGENT_MODULES = ("speldesigner", "utvecklare")
+
+@contextmanager
+def mocked_agent_factories():
+    """Patch all agent factories in one context manager."""
+    with ExitStack() as stack:
+        for name in AGENT_MODULES:
+            stack.enter_context(patch(f'agents.{name}.create_{name}_agent', return_value=MagicMock()))
+        yield
+
+@dataclass
+class TestResults:
+    """Track test results across the entire workflow."""
+    __test__ = False  # Result holder, not a test class - keep pytest from collecting it
+
+    projektledare_analysis: Optional[Dict[str, Any]] = None
+    stories_created: Optional[List[Dict[str, Any]]] = None
+    specification_created: Optional[bool] = None
+    artifacts_created: List[str] = field(default_factory=list)
+    errors_encountered: List[str] = field(default_factory=list)
@@ -0,0 +1,79 @@
+"""
+Shared fixtures for the integration test suites.
+"""
+
+import json
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def artifact_root(tmp_path_factory):
+    """
+    Per-session directory for generated specification artifacts. pytest's
+    basetemp retention cleans it up, so there is no per-test teardown.
+    """
+    return tmp_path_factory.mktemp("specs")
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """
+    Make asyncio.sleep return immediately so retry/backoff waits cost no wall
+    time. Opt-in only: polling loops (e.g. wait_for_workflow_status) need a
+    real sleep to yield to the event loop.
+    """
+    monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+
+
+@pytest.fixture(scope="session")
+def sample_spec():
+    """Canned specification returned by the mocked Claude LLM."""
+    return (FIXTURES_DIR / "sample_spec.md").read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def mock_speldesigner(monkeypatch, speldesigner, sample_spec):
+    """
+    The shared Speldesigner with its Claude LLM swapped for one that returns
+    the canned specification, so the tests exercise the workflow shape
+    without network calls. The agent factory is patched too, for code that
+    creates its own agent. monkeypatch restores the real LLM afterwards.
+    """
+    response = SimpleNamespace(content=sample_spec)
+    llm = MagicMock()
+    llm.invoke.return_value = response
+    llm.ainvoke = AsyncMock(return_value=response)
+
+    # Patch at the import site so agents created during the test get the mock too
+    monkeypatch.setattr("agents.speldesigner.ChatAnthropic", MagicMock(return_value=llm))
+    monkeypatch.setattr(speldesigner, "claude_llm", llm)  # also when no API key is configured
+    # Tests may point file_utils elsewhere; keep DNA read there off the shared agent
+    for cached in ("_design_principles", "_target_audience", "_system_prompt"):
+        monkeypatch.setattr(speldesigner, cached, None)
+    monkeypatch.setattr("agents.speldesigner.create_speldesigner_agent", lambda: speldesigner)
+    return speldesigner
+
+
+@pytest.fixture(scope="session")
+def sample_feature_analysis():
+    """Sample feature analysis (mock data from Projektledare)."""
+    return json.loads((FIXTURES_DIR / "sample_feature_analysis.json").read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="session")
+def sample_story_details():
+    """Sample story details for the specification tests."""
+    return json.loads((FIXTURES_DIR / "sample_story_details.json").read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="session")
+def validation_specification():
+    """Comprehensive specification used by the validation workflow test."""
+    return (FIXTURES_DIR / "validation_spec.md").read_text(encoding="utf-8")
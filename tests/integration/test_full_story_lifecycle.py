@@ -20,66 +20,35 @@ HOW TO RUN:
 
 import asyncio
 import json
-from pathlib import Path
-import sys
 import os
 import pytest
+import pytest_asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
-# Add project root to Python path
-project_root = Path(__file__).resolve().parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Agents come from the session fixtures in tests/conftest.py
+from tools.file_utils import read_file, stat_file, write_file
+from tests.integration._helpers import (
+    TestResults, print_section, print_success, print_info, print_error
+)
 
-# Import agents and tools
-from agents.projektledare import create_projektledare
-from agents.speldesigner import create_speldesigner_agent
-from tools.file_tools import read_file, write_file
-from config.settings import PROJECT_ROOT
+# One event loop for the module: the session fixtures and the tests share the
+# Projektledare's async Claude client, which must not cross event loops
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 @pytest.fixture(scope="session")
-def projektledare_instance():
-    """Create a single Projektledare instance for all tests."""
-    from agents.projektledare import ProjektledareAgent
-    return ProjektledareAgent()
-
-@pytest.fixture(scope="session")  
-def speldesigner_instance():
-    """Create a single Speldesigner instance for all tests."""
-    from agents.speldesigner import create_speldesigner_agent
-    return create_speldesigner_agent()
-
-# Test configuration
-REPORTS_DIR = PROJECT_ROOT / "reports"
-REPORTS_DIR.mkdir(parents=True, exist_ok=True)
-(REPORTS_DIR / "specs").mkdir(exist_ok=True)
-
-class TestResults:
-    """Track test results across the entire workflow."""
-    def __init__(self):
-        self.projektledare_analysis = None
-        self.stories_created = None
-        self.specification_created = None
-        self.artifacts_created = []
-        self.errors_encountered = []
-
-def print_test_section(title: str):
-    """Print clear test section headers."""
-    print(f"\n{'='*70}")
-    print(f"🧪 {title}")
-    print(f"{'='*70}")
-
-def print_success(message: str):
-    """Print success message."""
-    print(f"✅ {message}")
-
-def print_info(message: str):
-    """Print info message."""
-    print(f"ℹ️  {message}")
+def reports_dir(tmp_path_factory):
+    """
+    Per-session reports/ tree (with specs/) under a temporary project root.
+    pytest's basetemp retention cleans it up, so there is no teardown here.
+    """
+    reports = tmp_path_factory.mktemp("project") / "reports"
+    (reports / "specs").mkdir(parents=True)
+    return reports
 
-def print_error(message: str):
-    """Print error message."""
-    print(f"❌ {message}")
+REQUIRED_STORY_FIELDS = frozenset({"story_id", "title", "assigned_agent", "acceptance_criteria"})
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_github_issue():
     """Provide a realistic GitHub issue for testing."""
     return {
@@ -116,23 +85,34 @@ def mock_github_issue():
         "created_at": "2024-12-20T10:00:00Z"
     }
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def feature_analysis(projektledare, mock_github_issue):
+    """Analyze the mock issue once and share the result with the dependent tests."""
+    return await projektledare.analyze_feature_request(mock_github_issue)
+
+@pytest.fixture
+def mock_claude_llm(monkeypatch, projektledare, canned_feature_analysis):
+    """
+    Replace the Projektledare LLM boundary with a canned response so the
+    workflow shape - not model latency - is what gets tested.
+    """
+    response = SimpleNamespace(content=json.dumps(canned_feature_analysis))
+    llm = AsyncMock()
+    llm.ainvoke.return_value = response
+    monkeypatch.setattr(projektledare, "claude_llm", llm)
+    return llm
+
 @pytest.fixture
 def test_results():
     """Provide test results tracking."""
     return TestResults()
 
-@pytest.mark.asyncio
-async def test_projektledare_initialization():
+async def test_projektledare_initialization(projektledare):
     """Test that Projektledare can be initialized successfully."""
-    print_test_section("Test 1: Projektledare Initialization")
+    print_section("Test 1: Projektledare Initialization")
     
     try:
-        # FIXA: Skapa bara EN projektledare utan extra coordinator calls
-        from agents.projektledare import ProjektledareAgent
-        
-        # Skapa projektledare UTAN att anropa create_projektledare som skapar coordinator
-        projektledare = ProjektledareAgent()
-        
+        # The session fixture builds the single ProjektledareAgent (no coordinator)
         assert projektledare is not None
         assert hasattr(projektledare, 'claude_llm')
         assert hasattr(projektledare, 'agent')
@@ -145,16 +125,15 @@ async def test_projektledare_initialization():
         print_error(f"Failed to initialize Projektledare: {e}")
         pytest.fail(f"Projektledare initialization failed: {e}")
 
-@pytest.mark.asyncio
-async def test_feature_analysis(mock_github_issue, projektledare_instance):
+@pytest.mark.llm
+async def test_feature_analysis(mock_github_issue, feature_analysis):
     """Test feature analysis by Projektledare."""
-    print_test_section("Test 2: Feature Analysis")
+    print_section("Test 2: Feature Analysis")
     
     try:
-        projektledare = projektledare_instance
-        
         print_info(f"Analyzing issue: '{mock_github_issue['title']}'")
-        analysis_result = await projektledare.analyze_feature_request(mock_github_issue)
+        # The session fixture makes the single Claude call; story breakdown reuses it
+        analysis_result = feature_analysis
         
         # Validate analysis result structure
         assert isinstance(analysis_result, dict)
@@ -169,16 +148,14 @@ async def test_feature_analysis(mock_github_issue, projektledare_instance):
         print_error(f"Feature analysis failed: {e}")
         pytest.fail(f"Feature analysis failed: {e}")
 
-@pytest.mark.asyncio 
-async def test_story_breakdown(mock_github_issue, projektledare_instance):
+@pytest.mark.llm
+async def test_story_breakdown(mock_github_issue, projektledare, feature_analysis):
     """Test story breakdown creation."""
-    print_test_section("Test 3: Story Breakdown")
+    print_section("Test 3: Story Breakdown")
     
     try:
-        projektledare = create_projektledare()
-        
-        # First get analysis
-        analysis_result = await projektledare.analyze_feature_request(mock_github_issue)
+        # Reuse the session analysis instead of re-running it
+        analysis_result = feature_analysis
         
         # Then create stories
         stories = await projektledare.create_story_breakdown(analysis_result, mock_github_issue)
@@ -187,12 +164,13 @@ async def test_story_breakdown(mock_github_issue, projektledare_instance):
         assert isinstance(stories, list)
         assert len(stories) > 0
         
-        # Check story structure
-        for story in stories:
-            assert "story_id" in story
-            assert "title" in story
-            assert "assigned_agent" in story
-            assert "acceptance_criteria" in story
+        # Check story structure (one assertion listing every incomplete story)
+        missing = [
+            (story.get("story_id", "?"), sorted(REQUIRED_STORY_FIELDS - story.keys()))
+            for story in stories
+            if not REQUIRED_STORY_FIELDS <= story.keys()
+        ]
+        assert not missing, f"Stories missing keys: {missing}"
             
         print_success(f"Created {len(stories)} stories successfully")
         for story in stories:
@@ -204,13 +182,11 @@ async def test_story_breakdown(mock_github_issue, projektledare_instance):
         print_error(f"Story breakdown failed: {e}")
         pytest.fail(f"Story breakdown failed: {e}")
 
-@pytest.mark.asyncio
-async def test_speldesigner_initialization():
+async def test_speldesigner_initialization(speldesigner):
     """Test Speldesigner agent initialization."""
-    print_test_section("Test 4: Speldesigner Initialization")
+    print_section("Test 4: Speldesigner Initialization")
     
     try:
-        speldesigner = create_speldesigner_agent()
         assert speldesigner is not None
         assert hasattr(speldesigner, 'agent')
         print_success("Speldesigner initialized successfully")
@@ -219,48 +195,41 @@ async def test_speldesigner_initialization():
         print_error(f"Failed to initialize Speldesigner: {e}")
         pytest.fail(f"Speldesigner initialization failed: {e}")
 
-@pytest.mark.asyncio
-async def test_file_operations():
+async def test_file_operations(tmp_path, monkeypatch):
     """Test file reading and writing operations."""
-    print_test_section("Test 5: File Operations")
+    print_section("Test 5: File Operations")
+    
+    # Resolve the tool's relative paths under a per-test directory instead of the repo
+    monkeypatch.setattr("tools.file_utils.PROJECT_ROOT", tmp_path)
     
     try:
         # Test file writing
         test_content = "# Test Specification\n\nThis is a test file created by the AI team."
-        test_file_path = "reports/test_spec.md"
+        # docs/specs/ is on both the read and the write allow-list, so the round trip works
+        test_file_path = "docs/specs/test_spec.md"
         
         write_result = write_file(
             file_path=test_file_path,
-            content=test_content,
-            agent_name="test_runner"
+            content=test_content
         )
         
         assert "successfully" in write_result.lower()
+        assert (tmp_path / test_file_path).exists()
         print_success("File write operation successful")
         
         # Test file reading
-        read_content = read_file(
-            file_path=test_file_path,
-            agent_name="test_runner"
-        )
+        read_content = read_file(file_path=test_file_path)
         
         assert read_content == test_content
         print_success("File read operation successful")
-        
-        # Cleanup
-        test_file = PROJECT_ROOT / test_file_path
-        if test_file.exists():
-            test_file.unlink()
-            print_info("Test file cleaned up")
             
     except Exception as e:
         print_error(f"File operations failed: {e}")
         pytest.fail(f"File operations failed: {e}")
 
-@pytest.mark.asyncio
 async def test_dna_documents_accessibility():
     """Test that DNA documents can be read by agents."""
-    print_test_section("Test 6: DNA Documents Access")
+    print_section("Test 6: DNA Documents Access")
     
     dna_files = [
         "docs/dna/vision_and_mission.md",
@@ -271,29 +240,24 @@ async def test_dna_documents_accessibility():
     
     accessible_files = []
     
+    # Only existence and size are needed here, so stat the files instead of reading them
     for dna_file in dna_files:
-        try:
-            content = read_file(dna_file, agent_name="test_runner")
-            if not content.startswith("❌"):
-                accessible_files.append(dna_file)
-                print_success(f"✓ {dna_file} accessible ({len(content)} chars)")
-            else:
-                print_error(f"✗ {dna_file} not accessible: {content}")
-        except Exception as e:
-            print_error(f"✗ {dna_file} error: {e}")
+        exists, size_bytes = stat_file(dna_file)
+        if exists:
+            accessible_files.append(dna_file)
+            print_success(f"✓ {dna_file} accessible ({size_bytes} bytes)")
+        else:
+            print_error(f"✗ {dna_file} not accessible")
     
     # At least some DNA documents should be accessible
     assert len(accessible_files) >= 2, f"Too few DNA documents accessible: {accessible_files}"
     print_success(f"DNA documents accessibility verified ({len(accessible_files)}/{len(dna_files)} accessible)")
 
-@pytest.mark.asyncio
-async def test_agent_tool_integration():
+async def test_agent_tool_integration(speldesigner):
     """Test that agents can use their tools correctly."""
-    print_test_section("Test 7: Agent Tool Integration")
+    print_section("Test 7: Agent Tool Integration")
     
     try:
-        speldesigner = create_speldesigner_agent()
-        
         # Check that agent has tools
         assert hasattr(speldesigner.agent, 'tools')
         tools = speldesigner.agent.tools
@@ -307,21 +271,23 @@ async def test_agent_tool_integration():
         print_error(f"Agent tool integration test failed: {e}")
         pytest.fail(f"Agent tool integration failed: {e}")
 
-@pytest.mark.asyncio
-async def test_full_lifecycle_simplified():
+async def test_full_lifecycle_simplified(projektledare, speldesigner, mock_claude_llm,
+                                         reports_dir, monkeypatch):
     """
     Simplified test that verifies the basic workflow without running the full CrewAI chain.
-    This tests individual components rather than the full integration.
+    This tests individual components rather than the full integration; the Claude
+    call is mocked so the run is deterministic and does not hit the network.
     """
-    print_test_section("Test 8: Simplified Full Lifecycle")
+    print_section("Test 8: Simplified Full Lifecycle")
     
     results = TestResults()
     
+    # Write the lifecycle artifacts into the session reports dir, not the repo tree
+    monkeypatch.setattr("tools.file_utils.PROJECT_ROOT", reports_dir.parent)
+    
     try:
-        # Step 1: Initialize agents
+        # Step 1: Initialize agents (shared session instances)
         print_info("Step 1: Initializing agents...")
-        projektledare = create_projektledare()
-        speldesigner = create_speldesigner_agent()
         
         # Step 2: Mock GitHub issue
         mock_issue = {
@@ -337,6 +303,8 @@ async def test_full_lifecycle_simplified():
         analysis = await projektledare.analyze_feature_request(mock_issue)
         results.projektledare_analysis = analysis
         assert isinstance(analysis, dict)
+        assert analysis["recommendation"]["action"] == "approve"
+        mock_claude_llm.ainvoke.assert_awaited_once()
         print_success("Feature analysis completed")
         
         # Step 4: Story breakdown
@@ -369,8 +337,7 @@ Test technical requirements.
         spec_file_path = f"reports/specs/test_spec_F{mock_issue['number']}.md"
         write_result = write_file(
             file_path=spec_file_path,
-            content=spec_content.strip(),
-            agent_name="test_lifecycle"
+            content=spec_content.strip()
         )
         
         assert "successfully" in write_result.lower()
@@ -380,25 +347,20 @@ Test technical requirements.
         
         # Step 6: Validate created file
         print_info("Step 5: Validating created artifacts...")
-        created_spec = read_file(spec_file_path, agent_name="test_lifecycle")
+        # reports/ is write-only for agents (not in ALLOWED_READ_PATHS), so read it directly
+        created_spec = (reports_dir.parent / spec_file_path).read_text(encoding="utf-8")
         assert "Feature Specification" in created_spec
         assert mock_issue['title'] in created_spec
         print_success("Created specification validated")
         
         # Summary
-        print_test_section("Test Results Summary")
+        print_section("Test Results Summary")
         print_success("✅ All lifecycle components working correctly")
         print_info(f"Analysis completed: {results.projektledare_analysis is not None}")
         print_info(f"Stories created: {len(results.stories_created) if results.stories_created else 0}")
         print_info(f"Specification created: {results.specification_created}")
         print_info(f"Artifacts created: {len(results.artifacts_created)}")
         
-        # Cleanup
-        cleanup_file = PROJECT_ROOT / spec_file_path
-        if cleanup_file.exists():
-            cleanup_file.unlink()
-            print_info("Test artifacts cleaned up")
-        
         return results
         
     except Exception as e:
@@ -408,4 +370,4 @@ Test technical requirements.
 
 if __name__ == "__main__":
     # Run tests individually for debugging
-    pytest.main([__file__, "-v", "-s"])
\ No newline at end of file
+    pytest.main([__file__, "-v", "-s", "-o", "log_cli=true", "--log-cli-level=INFO"])
\ No newline at end of file
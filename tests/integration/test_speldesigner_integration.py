@@ -17,7 +17,7 @@ WHAT THIS TESTS:
 6. File creation and artifact management
 
 HOW TO RUN:
-    python tests/integration/test_speldesigner_integration.py
+    pytest tests/integration/test_speldesigner_integration.py -v -s
 
 EXPECTED OUTPUT:
 - Successful agent initialization
@@ -26,495 +26,244 @@ EXPECTED OUTPUT:
 - Generated specification files
 """
 
-import sys
 import asyncio
-import json
-from pathlib import Path
-from datetime import datetime
-import os
-
-# Add project root to Python path
-project_root = Path(__file__).resolve().parent.parent.parent
-sys.path.insert(0, str(project_root))
-
-try:
-    from agents.speldesigner import create_speldesigner_agent, create_demo_specification
-    from tools.design_tools import (
-        DesignPrinciplesValidatorTool,
-        AcceptanceCriteriaValidatorTool,
-        AnnaPersonaValidatorTool
+import orjson
+import re
+import pytest
+from freezegun import freeze_time
+
+import tools.file_utils as file_utils
+from tests.integration._helpers import (
+    print_section, print_success, print_info, print_warning
+)
+
+# Keywords every generated specification must mention (matched in one pass)
+_SPEC_KEYWORDS = re.compile(r"story id|anna", re.IGNORECASE)
+
+# Mark all tests in this file as async; retry/backoff sleeps are skipped
+pytestmark = [pytest.mark.asyncio, pytest.mark.usefixtures("no_sleep")]
+
+@pytest.fixture
+def design_tools():
+    """
+    The design validator tools module. tools/design_tools.py is not part of
+    this tree yet, so the tests that need it are skipped instead of erroring.
+    """
+    return pytest.importorskip("tools.design_tools")
+
+@pytest.fixture
+def spec_root(artifact_root, monkeypatch):
+    """
+    Point the agent's file utilities at the session artifact directory, so
+    specification files never land in the repository.
+    """
+    monkeypatch.setattr(file_utils, "PROJECT_ROOT", artifact_root)
+    return artifact_root
+
+@pytest.mark.slow
+@pytest.mark.llm
+async def test_agent_initialization(speldesigner):
+    """Smoke test: initialize the real (un-mocked) Speldesigner agent."""
+    print_section("Test 1: Agent Initialization")
+
+    # Verify agent structure
+    assert speldesigner.claude_llm is not None, "Agent should have Claude LLM"
+
+    # Verify the DNA context that goes into every specification prompt
+    design_principles = speldesigner.get_design_principles()
+    target_audience = speldesigner.get_target_audience()
+    assert design_principles.strip(), "Should have design principles"
+    assert target_audience.strip(), "Should have target audience"
+    system_prompt = speldesigner.get_system_prompt()
+    assert design_principles in system_prompt and target_audience in system_prompt
+
+    print_success("Speldesigner agent initialized successfully")
+    print_info(f"Model: {speldesigner.claude_llm.model}")
+    print_info(f"System prompt: {len(system_prompt)} characters")
+
+async def test_tool_integration(design_tools):
+    """Test that design tools work independently."""
+    print_section("Test 2: Design Tools Integration")
+
+    print_info("Testing individual design tools...")
+
+    sample_spec = "Professional progress tracking interface with clean design and accessibility features."
+    sample_criteria = [
+        "Progress bar shows completion percentage",
+        "Interface loads within 2 seconds",
+        "All elements are mobile responsive"
+    ]
+
+    # The three validators are independent; _run is blocking, so run each in a thread
+    print_info("Running Design Principles, Acceptance Criteria and Anna Persona validators...")
+    principles_result, criteria_result, persona_result = await asyncio.gather(
+        asyncio.to_thread(design_tools.DesignPrinciplesValidatorTool()._run, sample_spec),
+        asyncio.to_thread(design_tools.AcceptanceCriteriaValidatorTool()._run, sample_criteria),
+        asyncio.to_thread(design_tools.AnnaPersonaValidatorTool()._run, sample_spec),
     )
-    from config.settings import PROJECT_ROOT
-    from tools.file_tools import read_file
-    print("✅ Successfully imported Speldesigner and design tools")
-except ImportError as e:
-    print(f"❌ Import error: {e}")
-    print("Make sure you're running this from the project root directory")
-    sys.exit(1)
-
-def print_section(title: str):
-    """Print clear test section headers."""
-    print(f"\n{'='*70}")
-    print(f"🧪 {title}")
-    print(f"{'='*70}")
-
-def print_success(message: str):
-    """Print success message."""
-    print(f"✅ {message}")
-
-def print_info(message: str):
-    """Print info message."""
-    print(f"ℹ️  {message}")
-
-def print_error(message: str):
-    """Print error message."""
-    print(f"❌ {message}")
-
-def print_warning(message: str):
-    """Print warning message."""
-    print(f"⚠️  {message}")
-
-class SpeldesignerIntegrationTest:
-    """Complete integration test for Speldesigner agent."""
-
-    def __init__(self):
-        self.test_results = {
-            "agent_initialization": False,
-            "tool_integration": False,
-            "specification_creation": False,
-            "validation_workflow": False,
-            "file_management": False,
-            "end_to_end_workflow": False
-        }
-        self.created_files = [] # To track files for cleanup
-
-        # Sample feature analysis (mock data from Projektledare)
-        self.sample_feature_analysis = {
-            "dna_alignment": {
-                "vision_mission_aligned": True,
-                "target_audience_served": True,
-                "design_principles_compatible": True,
-                "concerns": []
-            },
-            "technical_feasibility": {
-                "architecture_compatible": True,
-                "deployment_feasible": True,
-                "api_design_clear": True,
-                "technical_risks": ["Integration complexity with existing user system"]
-            },
-            "complexity": {
-                "estimated_stories": 4,
-                "required_agents": ["speldesigner", "utvecklare", "testutvecklare", "qa_testare"],
-                "estimated_days": 6,
-                "complexity_level": "Medium"
-            },
-            "recommendation": {
-                "action": "approve",
-                "priority": "medium",
-                "reasoning": "Feature aligns well with user needs and technical architecture"
-            }
-        }
-
-        # Sample story details
-        self.sample_story_details = {
-            "story_id": "STORY-TEST-001",
-            "title": "User Progress Tracking Dashboard",
-            "description": "Create intuitive progress tracking interface for Anna to monitor her digitalization learning journey",
-            "user_value": "Anna can see her learning progress, stay motivated, and demonstrate ROI to management",
-            "estimated_effort": "Medium",
-            "acceptance_criteria": [
-                "Display completion percentage in visual progress bar",
-                "Show list of completed topics with checkmarks",
-                "Indicate time invested in learning activities",
-                "Provide quick access to continue learning"
-            ]
-        }
-
-    async def run_integration_tests(self) -> dict:
-        """Run all integration tests."""
-        print_section("Speldesigner Agent - Integration Test Suite")
-        print_info("Testing complete integration between Speldesigner and design tools")
-
-        try:
-            # Run tests in order
-            await self.test_agent_initialization()
-            await self.test_tool_integration()
-            await self.test_specification_creation()
-            await self.test_validation_workflow()
-            await self.test_file_management()
-            await self.test_end_to_end_workflow()
-        finally:
-            self.cleanup_files()
-            
-        return self.test_results
-
-    def cleanup_files(self):
-        """Clean up any files created during the tests."""
-        if not self.created_files:
-            return
-            
-        print_section("Cleaning Up Test Artifacts")
-        for file_path in self.created_files:
-            try:
-                full_path = PROJECT_ROOT / file_path
-                if full_path.exists():
-                    os.remove(full_path)
-                    print_info(f"Removed test file: {full_path}")
-            except Exception as e:
-                print_error(f"Failed to clean up file {file_path}: {e}")
-        self.created_files = []
-
-
-    async def test_agent_initialization(self):
-        """Test Speldesigner agent initialization."""
-        print_section("Test 1: Agent Initialization")
-
-        try:
-            print_info("Creating Speldesigner agent...")
-            speldesigner = create_speldesigner_agent()
-
-            # Verify agent structure
-            assert hasattr(speldesigner, 'agent'), "Agent should have CrewAI agent"
-            assert hasattr(speldesigner, 'agent_config'), "Agent should have configuration"
-            assert hasattr(speldesigner, 'domain_context'), "Agent should have domain context"
-            assert hasattr(speldesigner, 'claude_llm'), "Agent should have Claude LLM"
-
-            # Verify agent configuration
-            assert speldesigner.agent_config.llm_model, "Should have LLM model configured"
-            assert speldesigner.agent_config.specialization_focus, "Should have specializations"
-
-            # Verify tools are available
-            tools = speldesigner.agent.tools
-            assert len(tools) > 0, "Agent should have tools configured"
-
-            print_success("Speldesigner agent initialized successfully")
-            print_info(f"Model: {speldesigner.agent_config.llm_model}")
-            print_info(f"Temperature: {speldesigner.agent_config.temperature}")
-            print_info(f"Tools available: {len(tools)}")
-            print_info(f"Specializations: {len(speldesigner.agent_config.specialization_focus)}")
-
-            self.test_results["agent_initialization"] = True
-            return speldesigner
-
-        except Exception as e:
-            print_error(f"Agent initialization failed: {e}")
-            self.test_results["agent_initialization"] = False
-            return None
-
-    async def test_tool_integration(self):
-        """Test that design tools work independently."""
-        print_section("Test 2: Design Tools Integration")
-
-        try:
-            print_info("Testing individual design tools...")
-
-            # Test Design Principles Validator
-            print_info("Testing Design Principles Validator...")
-            principles_tool = DesignPrinciplesValidatorTool()
-
-            sample_spec = "Professional progress tracking interface with clean design and accessibility features."
-            principles_result = principles_tool._run(sample_spec)
-            principles_data = json.loads(principles_result)
-
-            assert "overall_score" in principles_data, "Should return overall score"
-            print_success("Design Principles Validator working")
-
-            # Test Acceptance Criteria Validator
-            print_info("Testing Acceptance Criteria Validator...")
-            criteria_tool = AcceptanceCriteriaValidatorTool()
-
-            sample_criteria = [
-                "Progress bar shows completion percentage",
-                "Interface loads within 2 seconds",
-                "All elements are mobile responsive"
-            ]
-            criteria_result = criteria_tool._run(sample_criteria)
-            criteria_data = json.loads(criteria_result)
-
-            assert isinstance(criteria_data, list), "Should return list of validations"
-            assert len(criteria_data) == len(sample_criteria), "Should validate all criteria"
-            print_success("Acceptance Criteria Validator working")
-
-            # Test Anna Persona Validator
-            print_info("Testing Anna Persona Validator...")
-            persona_tool = AnnaPersonaValidatorTool()
-
-            persona_result = persona_tool._run(sample_spec)
-            persona_data = json.loads(persona_result)
-
-            assert "anna_alignment_score" in persona_data, "Should return Anna alignment score"
-            print_success("Anna Persona Validator working")
-
-            print_success("All design tools integrated successfully")
-            self.test_results["tool_integration"] = True
-
-        except Exception as e:
-            print_error(f"Tool integration test failed: {e}")
-            self.test_results["tool_integration"] = False
-
-    async def test_specification_creation(self):
-        """Test UX specification creation workflow."""
-        print_section("Test 3: UX Specification Creation")
-
-        try:
-            print_info("Testing UX specification creation...")
-
-            # Create Speldesigner agent
-            speldesigner = create_speldesigner_agent()
-
-            # Test specification creation
-            print_info("Creating UX specification...")
-            spec_result = await speldesigner.create_ux_specification(
-                self.sample_feature_analysis,
-                self.sample_story_details
-            )
-            if spec_result.get("specification_file"):
-                self.created_files.append(spec_result["specification_file"])
-
-
-            # Verify result structure
-            assert isinstance(spec_result, dict), "Should return dictionary"
-            assert "story_id" in spec_result, "Should include story ID"
-            assert "specification" in spec_result, "Should include specification content"
-
-            # Check if specification was created successfully
-            if spec_result.get("error"):
-                print_warning(f"Specification creation had errors: {spec_result['error']}")
-                success = spec_result.get("specification") is not None
-            else:
-                success = True
-                print_success("UX specification created successfully")
-
-                # Verify specification content
-                specification = spec_result.get("specification", "")
-                assert len(specification) > 100, "Specification should have substantial content"
-                assert "story id" in specification.lower(), "Should reference story ID"
-                assert "anna" in specification.lower(), "Should reference Anna persona"
-
-                print_info(f"Specification length: {len(specification)} characters")
-
-                # Show validation results if available
-                validation_results = spec_result.get("validation_results", {})
-                if validation_results:
-                    overall_score = validation_results.get("overall_score", 0)
-                    print_info(f"Design validation score: {overall_score:.2f}")
-
-            self.test_results["specification_creation"] = success
-
-        except Exception as e:
-            print_error(f"Specification creation test failed: {e}")
-            self.test_results["specification_creation"] = False
-
-    async def test_validation_workflow(self):
-        """Test the complete validation workflow."""
-        print_section("Test 4: Validation Workflow")
-
-        try:
-            print_info("Testing complete validation workflow...")
-
-            # Create a comprehensive specification for testing
-            test_specification = """
-            # User Progress Tracking Interface
-            
-            ## Overview
-            Professional dashboard for Anna to track digitalization learning progress.
-            
-            ## Design Principles Alignment
-            - Pedagogical: Shows learning achievements and progress
-            - Practical: Connects time invested to competency gained
-            - Time-efficient: Quick overview in under 30 seconds
-            - Systems thinking: Shows interconnections between topics
-            - Professional: Clean, institutional design aesthetic
-            
-            ## User Experience
-            - Clean progress bar with percentage
-            - List of completed topics with checkmarks
-            - Time tracking for learning investment
-            - Quick access to continue learning
-            
-            ## Technical Implementation
-            - React component with responsive design
-            - FastAPI backend for progress data
-            - < 2 second load time
-            - Mobile-first design approach
-            """
-
-            # Test Design Principles Validation
-            print_info("Running design principles validation...")
-            principles_tool = DesignPrinciplesValidatorTool()
-            principles_result = principles_tool._run(test_specification)
-            principles_data = json.loads(principles_result)
-
-            overall_score = principles_data.get("overall_score", 0)
-            print_info(f"Design principles score: {overall_score:.2f}")
-
-            # Test with comprehensive acceptance criteria
-            test_criteria = [
-                "Progress bar displays completion percentage from 0-100% with accurate calculation",
-                "Completed topics show green checkmarks and highlight completed status",
-                "Time spent learning displays in hours:minutes format (e.g., '2:45')",
-                "Interface loads completely within 2 seconds on desktop and mobile devices",
-                "All interactive elements have 44px minimum touch targets for accessibility",
-                "Progress data persists between user sessions without loss",
-                "User can navigate back to dashboard with single click or tap",
-                "Screen reader announces progress in logical order with proper ARIA labels"
-            ]
-
-            print_info("Running acceptance criteria validation...")
-            criteria_tool = AcceptanceCriteriaValidatorTool()
-            criteria_result = criteria_tool._run(test_criteria)
-            criteria_data = json.loads(criteria_result)
-
-            # Count high-quality criteria
-            good_criteria = sum(1 for item in criteria_data
-                                if item.get("overall_quality") in ["good", "excellent"])
-            print_info(f"High-quality criteria: {good_criteria}/{len(criteria_data)}")
-
-            # Test Anna persona validation
-            print_info("Running Anna persona validation...")
-            persona_tool = AnnaPersonaValidatorTool()
-            persona_result = persona_tool._run(test_specification)
-            persona_data = json.loads(persona_result)
-
-            anna_score = persona_data.get("anna_alignment_score", 0)
-            print_info(f"Anna alignment score: {anna_score:.2f}")
-
-            # Determine success based on reasonable scores
-            validation_success = (
-                overall_score > 0.5 and  # At least 50% on design principles
-                good_criteria >= len(test_criteria) * 0.6 and  # 60% good criteria
-                anna_score > 0.5  # At least 50% Anna alignment
-            )
-
-            if validation_success:
-                print_success("Validation workflow completed successfully")
-            else:
-                print_warning("Validation workflow completed with low scores")
-                print_info("This may be expected in fallback mode without AI")
-
-            self.test_results["validation_workflow"] = True  # Process worked, even if scores are low
-
-        except Exception as e:
-            print_error(f"Validation workflow test failed: {e}")
-            self.test_results["validation_workflow"] = False
-
-    async def test_file_management(self):
-        """Test file creation and management."""
-        print_section("Test 5: File Management")
-        
-        try:
-            print_info("Testing file creation as part of the agent workflow...")
-            
-            # Use the demo function which triggers the full file-saving workflow
-            # KORRIGERING: Passar story_id för att vara konsekvent, även om det är hårdkodat
-            result = await create_demo_specification("FILE-TEST-001") 
-            
-            # Check for errors first
-            assert "error" not in result, f"File management test failed with error: {result.get('error')}"
-            
-            # Get the path of the created file
-            spec_file_path_str = result.get("specification_file")
-            assert spec_file_path_str, "Workflow should return the path of the created file"
-            
-            # Add to cleanup list
-            self.created_files.append(spec_file_path_str)
-            
-            # Verify the file was actually created
-            full_path = PROJECT_ROOT / spec_file_path_str
-            assert full_path.exists(), f"Specification file was not created at {full_path}"
-            assert full_path.stat().st_size > 100, "Specification file should not be empty"
-            print_success(f"File created successfully at: {spec_file_path_str}")
-            
-            # Verify file content
-            content = read_file(str(full_path), "test_runner")
-            # KORRIGERING: Testar mot det faktiska, hårdkodade ID:t från demo-funktionen
-            assert "STORY ID: STORY-DEMO-001" in content.upper(), "File content should match the demo story ID"
-            print_success("File content verified")
-            
-            self.test_results["file_management"] = True
-            
-        except Exception as e:
-            print_error(f"File management test failed: {e}")
-            import traceback
-            traceback.print_exc()
-            self.test_results["file_management"] = False
-
-
-    async def test_end_to_end_workflow(self):
-        """Test the complete end-to-end workflow."""
-        print_section("Test 6: End-to-End Workflow")
-        
-        try:
-            print_info("Running complete end-to-end workflow test...")
-            
-            # The create_demo_specification function already wraps the full workflow
-            result = await create_demo_specification("E2E-TEST-001")
-            
-            # Add file to cleanup list
-            if result.get("specification_file"):
-                self.created_files.append(result["specification_file"])
-                
-            # 1. Check for errors
-            assert "error" not in result, f"End-to-end test failed with an error: {result.get('error')}"
-            print_success("Workflow completed without errors")
-            
-            # 2. Check for key artifacts in the result
-            assert "specification" in result and result["specification"], "Should produce a specification"
-            assert "validation_results" in result and result["validation_results"], "Should produce validation results"
-            assert "acceptance_criteria" in result and result["acceptance_criteria"], "Should produce acceptance criteria"
-            assert "specification_file" in result and result["specification_file"], "Should produce a file path"
-            print_success("All key artifacts were generated")
-            
-            # 3. Validate the content of the artifacts
-            validation_score = result["validation_results"].get("overall_score", 0)
-            assert validation_score > 0.5, f"Validation score {validation_score:.2f} is too low"
-            print_info(f"Validation score: {validation_score:.2f} (PASS)")
-            
-            criteria_count = len(result["acceptance_criteria"])
-            assert criteria_count > 5, f"Expected more than 5 acceptance criteria, but got {criteria_count}"
-            print_info(f"Generated {criteria_count} acceptance criteria (PASS)")
-            
-            # 4. Verify file was created
-            spec_file_path = PROJECT_ROOT / result["specification_file"]
-            assert spec_file_path.exists() and spec_file_path.stat().st_size > 100
-            print_success(f"Specification file verified at: {spec_file_path}")
-            
-            self.test_results["end_to_end_workflow"] = True
-            
-        except Exception as e:
-            print_error(f"End-to-end workflow test failed: {e}")
-            import traceback
-            traceback.print_exc()
-            self.test_results["end_to_end_workflow"] = False
-
-
-def print_final_results(test_results: dict):
-    """Print summary of all test results."""
-    print_section("Test Results Summary")
+
+    # Design Principles Validator
+    principles_data = orjson.loads(principles_result)
+    assert "overall_score" in principles_data, "Should return overall score"
+    print_success("Design Principles Validator working")
+
+    # Acceptance Criteria Validator
+    criteria_data = orjson.loads(criteria_result)
+    assert isinstance(criteria_data, list), "Should return list of validations"
+    assert len(criteria_data) == len(sample_criteria), "Should validate all criteria"
+    print_success("Acceptance Criteria Validator working")
+
+    # Anna Persona Validator
+    persona_data = orjson.loads(persona_result)
+    assert "anna_alignment_score" in persona_data, "Should return Anna alignment score"
+    print_success("Anna Persona Validator working")
+
+    print_success("All design tools integrated successfully")
+
+async def test_specification_creation(mock_speldesigner, sample_feature_analysis, sample_story_details, spec_root):
+    """Test UX specification creation workflow."""
+    print_section("Test 3: UX Specification Creation")
+
+    print_info("Testing UX specification creation...")
+
+    # Test specification creation; the feature analysis travels in the request body
+    print_info("Creating UX specification...")
+    spec_result = await mock_speldesigner.create_ux_specification(
+        feature_request(sample_story_details["story_id"], sample_story_details, sample_feature_analysis)
+    )
+
+    # Verify result structure
+    assert isinstance(spec_result, dict), "Should return dictionary"
+    assert "error" not in spec_result, f"Specification creation failed: {spec_result.get('error')}"
+    assert spec_result["story_id"] == sample_story_details["story_id"], "Should include story ID"
+    print_success("UX specification created successfully")
+
+    # Verify specification content
+    specification = spec_result["specification_content"]
+    assert len(specification) > 100, "Specification should have substantial content"
+    found = {match.group(0).lower() for match in _SPEC_KEYWORDS.finditer(specification)}
+    assert "story id" in found, "Should reference story ID"
+    assert "anna" in found, "Should reference Anna persona"
+
+    print_info(f"Specification length: {len(specification)} characters")
+    print_info(f"Design validation score: {spec_result['validation_results']['overall_score']:.2f}")
+
+async def test_validation_workflow(design_tools, validation_specification):
+    """Test the complete validation workflow."""
+    print_section("Test 4: Validation Workflow")
+
+    print_info("Testing complete validation workflow...")
+
+    # Test with comprehensive acceptance criteria
+    test_criteria = [
+        "Progress bar displays completion percentage from 0-100% with accurate calculation",
+        "Completed topics show green checkmarks and highlight completed status",
+        "Time spent learning displays in hours:minutes format (e.g., '2:45')",
+        "Interface loads completely within 2 seconds on desktop and mobile devices",
+        "All interactive elements have 44px minimum touch targets for accessibility",
+        "Progress data persists between user sessions without loss",
+        "User can navigate back to dashboard with single click or tap",
+        "Screen reader announces progress in logical order with proper ARIA labels"
+    ]
+
+    # Run design principles, acceptance criteria and Anna persona validation concurrently
+    print_info("Running design principles, acceptance criteria and Anna persona validation...")
+    principles_result, criteria_result, persona_result = await asyncio.gather(
+        asyncio.to_thread(design_tools.DesignPrinciplesValidatorTool()._run, validation_specification),
+        asyncio.to_thread(design_tools.AcceptanceCriteriaValidatorTool()._run, test_criteria),
+        asyncio.to_thread(design_tools.AnnaPersonaValidatorTool()._run, validation_specification),
+    )
+
+    principles_data = orjson.loads(principles_result)
+    overall_score = principles_data.get("overall_score", 0)
+    print_info(f"Design principles score: {overall_score:.2f}")
+
+    criteria_data = orjson.loads(criteria_result)
+    # Count high-quality criteria
+    good_criteria = sum(1 for item in criteria_data
+                        if item.get("overall_quality") in ["good", "excellent"])
+    print_info(f"High-quality criteria: {good_criteria}/{len(criteria_data)}")
+
+    persona_data = orjson.loads(persona_result)
+    anna_score = persona_data.get("anna_alignment_score", 0)
+    print_info(f"Anna alignment score: {anna_score:.2f}")
+
+    # Determine success based on reasonable scores
+    validation_success = (
+        overall_score > 0.5 and  # At least 50% on design principles
+        good_criteria >= len(test_criteria) * 0.6 and  # 60% good criteria
+        anna_score > 0.5  # At least 50% Anna alignment
+    )
+
+    if validation_success:
+        print_success("Validation workflow completed successfully")
+    else:
+        print_warning("Validation workflow completed with low scores")
+        print_info("This may be expected in fallback mode without AI")
+
+    # The process working is what counts here, even if scores are low
+
+def feature_request(story_id, story_details, feature_analysis=None):
+    """Feature request in the shape SpeldesignerAgent.create_ux_specification takes."""
+    body = story_details["description"]
+    if feature_analysis is not None:
+        body += "\n\nFeature analysis:\n" + orjson.dumps(feature_analysis, option=orjson.OPT_INDENT_2).decode()
+    return {"story_id": story_id, "title": story_details["title"], "body": body}
+
+def check_file_content(result, spec_path):
+    """File management: the saved file is the specification from the (mocked) LLM."""
+    content = file_utils.read_file(spec_path)
+    assert content == result["specification_content"], "Saved file should hold the specification"
+    # sample_spec.md is the canned LLM response and carries the demo story ID
+    assert "STORY ID: STORY-DEMO-001" in content.upper(), "File content should match the demo story ID"
+    print_success("File content verified")
+
+def check_artifacts(result, spec_path):
+    """End-to-end: every artifact is produced and meets the quality bar."""
+    assert result["specification_content"], "Should produce a specification"
+    assert "validation_results" in result and result["validation_results"], "Should produce validation results"
+    assert "acceptance_criteria" in result and result["acceptance_criteria"], "Should produce acceptance criteria"
+    print_success("All key artifacts were generated")
+
+    validation_score = result["validation_results"].get("overall_score", 0)
+    assert validation_score > 0.5, f"Validation score {validation_score:.2f} is too low"
+    print_info(f"Validation score: {validation_score:.2f} (PASS)")
+
+    criteria_count = len(result["acceptance_criteria"])
+    assert criteria_count > 5, f"Expected more than 5 acceptance criteria, but got {criteria_count}"
+    print_info(f"Generated {criteria_count} acceptance criteria (PASS)")
+
+@pytest.mark.parametrize("story_id,extra_checks", [
+    ("FILE-TEST-001", check_file_content),
+    ("E2E-TEST-001", check_artifacts),
+], ids=["file_management", "end_to_end"])
+@freeze_time("2024-01-01", real_asyncio=True)  # Deterministic timestamps in file names and results
+async def test_demo_workflow(story_id, extra_checks, mock_speldesigner, sample_story_details, spec_root):
+    """Test the specification workflow end to end, including the saved file."""
+    print_section(f"Test 5: Demo Workflow ({story_id})")
     
-    total_tests = len(test_results)
-    passed_tests = sum(1 for result in test_results.values() if result)
+    print_info("Running the specification workflow...")
     
-    print_info(f"Tests passed: {passed_tests}/{total_tests}")
+    # create_ux_specification wraps the full file-saving workflow (save_spec_file)
+    result = await mock_speldesigner.create_ux_specification(feature_request(story_id, sample_story_details))
     
-    for test_name, passed in test_results.items():
-        status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"  {test_name.replace('_', ' ').title()}: {status}")
+    # Check for errors first
+    assert "error" not in result, f"Demo workflow failed with error: {result.get('error')}"
+    assert result["file_saved"], f"Specification was not saved: {result['file_path']}"
+    print_success("Workflow completed without errors")
     
-    if passed_tests == total_tests:
-        print_success("🎉 All integration tests passed! Speldesigner is ready for duty.")
-    else:
-        print_error("🚨 Some integration tests failed. Please review the errors above.")
-
-async def main():
-    """Main function to run the test suite."""
-    test_suite = SpeldesignerIntegrationTest()
-    results = await test_suite.run_integration_tests()
-    print_final_results(results)
-
-    passed_tests = sum(1 for result in results.values() if result)
-    if passed_tests != len(results):
-        sys.exit(1) # Exit with error code if any test failed
+    # The frozen clock fixes the timestamp in the file name
+    spec_path = f"docs/specs/spec-{story_id}-20240101_000000.md"
+    assert result["file_path"].endswith(spec_path), f"Unexpected file: {result['file_path']}"
+    
+    # Verify the file was actually created
+    spec_file_path = spec_root / spec_path
+    assert spec_file_path.exists(), f"Specification file was not created at {spec_file_path}"
+    assert spec_file_path.stat().st_size > 100, "Specification file should not be empty"
+    print_success(f"Specification file verified at: {spec_path}")
+    
+    extra_checks(result, spec_path)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Run tests individually for debugging
+    pytest.main([__file__, "-v", "-s", "-o", "log_cli=true", "--log-cli-level=INFO"])
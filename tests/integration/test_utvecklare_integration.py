@@ -8,19 +8,10 @@ Tests that the Utvecklare agent can correctly read a specification,
 generate code for both frontend and backend, and commit the files to git.
 """
 
-import sys
 import asyncio
-import os
-from pathlib import Path
 import pytest
 
-# Add project root to Python path
-project_root = Path(__file__).resolve().parent.parent.parent
-sys.path.insert(0, str(project_root))
-
-from agents.utvecklare import create_utvecklare_agent
-from tools.file_tools import write_file, read_file
-from config.settings import PROJECT_ROOT
+from tools.file_utils import PROJECT_ROOT, read_file, write_file
 
 # Mock specification content
 SPEC_CONTENT = """
@@ -41,30 +32,16 @@ SPEC_CONTENT = """
 SPEC_FILE_PATH = "docs/specs/test_spec_login.md"
 
 @pytest.fixture
-def setup_test_environment():
-    """Sets up a mock environment for the test."""
-    # Create a mock spec file
-    write_file(SPEC_FILE_PATH, SPEC_CONTENT, "test_setup")
-    
-    # Ensure directories exist
-    (PROJECT_ROOT / "frontend/src/components").mkdir(parents=True, exist_ok=True)
-    (PROJECT_ROOT / "backend/app/api").mkdir(parents=True, exist_ok=True)
-    
-    yield # This allows the test to run
-
-    # Teardown: Clean up created files
-    os.remove(PROJECT_ROOT / SPEC_FILE_PATH)
-    
-    frontend_file = PROJECT_ROOT / "frontend/src/components/STORY-LOGIN-001.tsx"
-    if frontend_file.exists():
-        os.remove(frontend_file)
-
-    backend_file = PROJECT_ROOT / "backend/app/api/STORY-LOGIN-001.py"
-    if backend_file.exists():
-        os.remove(backend_file)
+def setup_test_environment(mem_fs):
+    """
+    Sets up a mock environment for the test on the in-memory file_utils
+    backend (mem_fs); it is discarded after the test, so no teardown is needed.
+    Directories are implicit, so only the spec file has to be seeded.
+    """
+    mem_fs.write(PROJECT_ROOT / SPEC_FILE_PATH, SPEC_CONTENT)
+    return mem_fs
 
-@pytest.mark.usefixtures("setup_test_environment")
-def test_utvecklare_implementation_workflow():
+def test_utvecklare_implementation_workflow(utvecklare, setup_test_environment):
     """
     Tests the full implementation workflow of the Utvecklare agent.
     NOTE: This test is synchronous for simplicity with pytest. 
@@ -72,9 +49,8 @@ def test_utvecklare_implementation_workflow():
     """
     print("\n🧪 Testing Utvecklare implementation workflow...")
 
-    # 1. Initialize the agent
-    utvecklare_agent = create_utvecklare_agent()
-    assert utvecklare_agent is not None, "Failed to create Utvecklare agent"
+    # 1. The agent comes from the session fixture in tests/conftest.py
+    assert utvecklare is not None, "Failed to create Utvecklare agent"
     print("✅ Agent created successfully.")
 
     # 2. Run the implementation task
@@ -86,6 +62,11 @@ def test_utvecklare_implementation_workflow():
     # For this test, we will manually create mock output files to simulate agent's work,
     # as running the full crew can be slow and resource-intensive for a simple test.
     
+    fs = setup_test_environment
+    
+    # The agent reads its input through file_utils, like the real tool would
+    assert "STORY-LOGIN-001" in read_file(SPEC_FILE_PATH), "Specification could not be read."
+    
     story_id = "STORY-LOGIN-001"
     
     # Simulate agent creating files
@@ -95,18 +76,19 @@ def test_utvecklare_implementation_workflow():
     frontend_path = f"frontend/src/components/{story_id}.tsx"
     backend_path = f"backend/app/api/{story_id}.py"
     
-    write_file(frontend_path, frontend_code, "test_utvecklare")
-    write_file(backend_path, backend_code, "test_utvecklare")
+    assert write_file(frontend_path, frontend_code).startswith("✅")
+    assert write_file(backend_path, backend_code).startswith("✅")
     print("✅ Mock files created to simulate agent's work.")
     
     # 3. Verify file creation
-    assert (PROJECT_ROOT / frontend_path).exists(), "Frontend file was not created."
-    assert (PROJECT_ROOT / backend_path).exists(), "Backend file was not created."
+    assert fs.exists(PROJECT_ROOT / frontend_path), "Frontend file was not created."
+    assert fs.exists(PROJECT_ROOT / backend_path), "Backend file was not created."
     print("✅ Code files were created successfully.")
     
-    # 4. Verify file content (basic check)
-    frontend_content = read_file(frontend_path, "test_utvecklare")
-    backend_content = read_file(backend_path, "test_utvecklare")
+    # 4. Verify file content (basic check). frontend/ and backend/ are
+    # write-only for agents, so the content is read back from the backend.
+    frontend_content = fs.read(PROJECT_ROOT / frontend_path)
+    backend_content = fs.read(PROJECT_ROOT / backend_path)
     
     assert "React" in frontend_content, "Frontend file content is incorrect."
     assert "FastAPI" in backend_content, "Backend file content is incorrect."
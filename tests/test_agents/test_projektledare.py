@@ -30,13 +30,8 @@ This is a BEGINNER-FRIENDLY test script with detailed output and error handling.
 import sys
 import asyncio
 import json
-from pathlib import Path
 
-# Add project root to Python path so we can import our modules
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
-
-# Now we can import our project modules
+# Import our project modules (tests/conftest.py puts the project root on sys.path)
 try:
     from agents.projektledare import create_projektledare, ProjektledareAgent
     from workflows.status_handler import StatusHandler
@@ -3,43 +3,157 @@ Isolerat Test-script för Speldesigner-agenten
 =============================================
 
 SYFTE:
-Detta script verifierar att Speldesigner-agenten kan ta emot en uppgift,
-använda sina specialiserade verktyg för att utföra den, och producera
-en högkvalitativ designspecifikation i enlighet med projektets DNA.
+Detta script verifierar att Speldesigner-agenten kan ta emot en feature-analys
+från Projektledaren och producera en designspecifikation i enlighet med
+projektets DNA.
 
 VAD DETTA TESTAR:
 1.  Agentens förmåga att förstå en uppgift från Projektledaren.
-2.  Användningen av `DesignPrinciplesValidatorTool` för att självgranska.
-3.  Användningen av `AcceptanceCriteriaValidatorTool` för att skapa testbara krav.
-4.  Användningen av `FileWriteTool` för att spara den slutgiltiga artefakten.
-5.  Den övergripande kvaliteten och strukturen på den genererade specifikationen.
+2.  Att specifikationen sparas via tools.file_utils (save_spec_file).
+3.  Att acceptanskriterierna extraheras ur den genererade specifikationen.
+4.  Att specifikationen valideras mot designprinciperna.
 """
 
 import asyncio
-import json
-from pathlib import Path
-import sys
+import functools
+import hashlib
+import orjson
 import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
-# Lägg till projektroten i sökvägen för att kunna importera moduler
-project_root = Path(__file__).resolve().parent.parent.parent
-sys.path.insert(0, str(project_root))
+import pytest
+import pytest_asyncio
 
-from crewai import Task, Crew
+# Agenterna kommer från sessions-fixturerna i tests/conftest.py. Analysprompten
+# ingår i cache-nyckeln; specifikationen sparas via file_utils (mem_fs i mocked-llm)
+from agents.projektledare import FEATURE_ANALYSIS_PROMPT_TEMPLATE
+from tools import file_utils
 
-# Importera agent-fabriker och verktyg
-from agents.projektledare import create_projektledare
-from agents.speldesigner import create_speldesigner_agent
-from tools.file_tools import read_file
-# Antagande: Vi lägger till en REPORTS_DIR i settings.py för att hantera artefakter
-from tools.context_tools import FileSearchTool
-from config.settings import PROJECT_ROOT
+# Maxtid för hela specifikationskörningen; ett hängande LLM-anrop ska fälla testet, inte CI
+SPEC_TIMEOUT_SEC = int(os.getenv("SPEC_TIMEOUT", "600"))
 
-# Definiera och säkerställ att rapport-katalogen finns
-REPORTS_DIR = PROJECT_ROOT / "reports"
-REPORTS_DIR.mkdir(parents=True, exist_ok=True)
-(REPORTS_DIR / "specs").mkdir(exist_ok=True)
+# Simulerad GitHub-issue som Projektledaren analyserar
+MOCK_GITHUB_ISSUE = {
+    "number": 123, "title": "Add user progress tracking to game",
+    "body": "As Anna, I want to see my progress to understand what I've learned."
+}
 
+# Story-ID som specifikationen sparas under (docs/specs/spec-<story_id>-<tid>.md)
+SPEC_STORY_ID = f"F{MOCK_GITHUB_ISSUE['number']}"
+
+# Svaret som den mockade Claude-klienten returnerar
+FAKE_SPEC = """# UX Specification: User Progress Tracking
+
+Story ID: STORY-123-001
+
+## Acceptance Criteria
+- [ ] Progress bar shows completion percentage for Anna
+- [ ] Interface loads within 2 seconds
+"""
+
+
+# Feature-beskrivningen för Speldesignern; bara analysen varierar mellan körningar
+SPEC_DESCRIPTION_TEMPLATE = """{issue_body}
+
+Analys från Projektledaren:
+---
+{analysis_json}
+---
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def build_spec_description(analysis_json: str) -> str:
+    """Bygger uppgiftsbeskrivningen en gång per serialiserad analys."""
+    return SPEC_DESCRIPTION_TEMPLATE.format(
+        issue_body=MOCK_GITHUB_ISSUE["body"], analysis_json=analysis_json
+    )
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def feature_analysis(projektledare, pytestconfig):
+    """
+    Projektledarens analys av MOCK_GITHUB_ISSUE. Claude-svar sparas i pytest-cachen
+    (.pytest_cache) under en hash av issue, modell och prompt, så LLM-anropet görs
+    bara när någon av dem ändras. Rensa med `pytest --cache-clear`.
+
+    Utan Claude, eller när agenten föll tillbaka på sin reservanalys (den fångar
+    alla fel), cachas inget: en senare körning med API-nyckel ska få ett riktigt svar.
+    """
+    if projektledare.claude_llm is None:
+        return await projektledare.analyze_feature_request(MOCK_GITHUB_ISSUE)
+
+    cache_input = {
+        "issue": MOCK_GITHUB_ISSUE,
+        "model": projektledare.claude_llm.model,
+        "prompt": FEATURE_ANALYSIS_PROMPT_TEMPLATE,
+    }
+    cache_hash = hashlib.sha256(orjson.dumps(cache_input, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    cache_key = f"feature_analysis/{cache_hash}"
+
+    analysis = pytestconfig.cache.get(cache_key, None)
+    if analysis is None:
+        analysis = await projektledare.analyze_feature_request(MOCK_GITHUB_ISSUE)
+        fallback = projektledare._create_fallback_analysis(
+            MOCK_GITHUB_ISSUE["title"], MOCK_GITHUB_ISSUE["body"]
+        )
+        # Misslyckade analyser och reservsvar ska inte återanvändas
+        if "error" not in analysis and analysis != fallback:
+            pytestconfig.cache.set(cache_key, analysis)
+    return analysis
+
+def serialize_analysis(analysis) -> str:
+    """Serialiserar en analys för uppgiftsbeskrivningen (orjson bevarar å/ä/ö)."""
+    return orjson.dumps(
+        analysis, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+@pytest.fixture(scope="session")
+def feature_analysis_json(feature_analysis):
+    """Projektledarens analys serialiserad en gång per session (används av real-llm)."""
+    return serialize_analysis(feature_analysis)
+
+@pytest.fixture
+def analysis_json(llm_mode, request):
+    """
+    Analysen som Speldesignern får. mocked-llm använder canned_feature_analysis
+    från tests/conftest.py; bara real-llm begär feature_analysis (och därmed
+    Projektledaren och Claude).
+    """
+    if llm_mode == "mock":
+        return serialize_analysis(request.getfixturevalue("canned_feature_analysis"))
+    return request.getfixturevalue("feature_analysis_json")
+
+@pytest.fixture(params=[
+    pytest.param("mock", id="mocked-llm"),
+    pytest.param("real", id="real-llm", marks=[pytest.mark.slow, pytest.mark.llm]),
+])
+def llm_mode(request):
+    """
+    "mock": Speldesignerns Claude-klient ersätts med en stub som returnerar
+    FAKE_SPEC, och filerna skrivs till mem_fs, så agentens egen kod (prompt,
+    extrahering, validering, sparande) testas utan LLM-trafik.
+    "real": det riktiga Claude-anropet (slow/llm, för nattliga CI-körningar).
+    """
+    return request.param
+
+@pytest.fixture
+def spec_backend(llm_mode, speldesigner, monkeypatch, request):
+    """
+    Filsystemet som specifikationen sparas i. I mocked-llm är det mem_fs, och
+    agentens prompt-cache nollställs via monkeypatch så att DNA-reservtexterna
+    från mem_fs inte följer med den delade agenten till senare tester.
+    """
+    if llm_mode == "real":
+        return file_utils._FS
+
+    llm = MagicMock()
+    llm.invoke.return_value = SimpleNamespace(content=FAKE_SPEC)
+    monkeypatch.setattr(speldesigner, "claude_llm", llm)
+    for cached in ("_design_principles", "_target_audience", "_system_prompt"):
+        monkeypatch.setattr(speldesigner, cached, None)
+    return request.getfixturevalue("mem_fs")
 
 def print_section(title: str):
     print(f"\n{'='*60}\n🧪 {title}\n{'='*60}")
@@ -50,80 +164,105 @@ def print_success(message: str):
 def print_info(message: str):
     print(f"ℹ️  {message}")
 
-async def test_speldesigner_specification_task():
+async def test_speldesigner_specification_task(analysis_json, speldesigner, llm_mode, spec_backend):
     """
     Testar Speldesigner-agentens hela arbetsflöde för att skapa en spec.
+    Agenterna kommer från sessions-fixturerna i tests/conftest.py.
     """
     print_section("Testar Speldesigner-agentens specifikations-uppgift")
 
     # --- STEG 1: SETUP ---
-    # Simulera input från Projektledaren.
-    print_info("Simulerar input från Projektledaren...")
-    projektledare = create_projektledare()
-    mock_github_issue = {
-        "number": 123, "title": "Add user progress tracking to game",
-        "body": "As Anna, I want to see my progress to understand what I've learned."
+    # Input från Projektledaren kommer från analysis_json-fixturen (fast analys i mocked-llm).
+    feature_request = {
+        "title": MOCK_GITHUB_ISSUE["title"],
+        "body": build_spec_description(analysis_json),
+        "story_id": SPEC_STORY_ID,
     }
-    feature_analysis = await projektledare.analyze_feature_request(mock_github_issue)
     print_success("Input från Projektledaren simulerad.")
 
-    # --- STEG 2: DEFINIERA UPPGIFTEN ---
-    # Skapa Speldesigner-agenten med sina verktyg
-    speldesigner = create_speldesigner_agent()
-
-    spec_file_path = REPORTS_DIR / "specs" / f"spec_F{mock_github_issue['number']}.md"
-    
-    design_task = Task(
-        description=f"""
-    Din uppgift är att skapa en komplett designspecifikation för featuren
-    "User Progress Tracking", baserat på den bifogade feature-analysen.
-
-    Analys från Projektledaren:
-    ---
-    {json.dumps(feature_analysis, indent=2, ensure_ascii=False)}
-    ---
-
-    VIKTIG ARBETSPROCESS: Du måste följa dessa steg i exakt ordning.
-    1.  **OBLIGATORISKT FÖRSTA STEG:** Du vet inte var DNA-filerna finns. Använd
-        verktyget `Filsökare` för att hitta de exakta, relativa sökvägarna till
-        `design_principles.md` och `target_audience.md`. Använd INTE `file_read_tool`
-        förrän du har en fullständig sökväg från `Filsökare`.
-    2.  Använd `file_read_tool` med de sökvägar du hittade för att läsa dokumenten.
-    3.  Skriv ett första utkast till en komplett specifikation.
-    4.  Använd dina valideringsverktyg (`AcceptanceCriteriaValidatorTool` och
-        `DesignPrinciplesValidatorTool`) för att granska och iterativt förbättra
-        ditt utkast tills det uppfyller alla kvalitetskrav.
-    5.  När specifikationen är validerad och klar, använd `FileWriteTool` för att
-        spara den till den relativa sökvägen: 'reports/specs/spec_F123.md'.
-    """,
-        expected_output=f"En bekräftelse på att den färdiga och validerade specifikationen har sparats till 'reports/specs/spec_F123.md'.",
-        agent=speldesigner
-    )
-
-    # --- STEG 3: KÖR UPPGIFTEN ---
-    print_info(f"Startar Speldesigner-agenten...")
-    game_design_crew = Crew(
-        agents=[speldesigner],
-        tasks=[design_task],
-        verbose=True
-    )
-    result = game_design_crew.kickoff()
+    # --- STEG 2: KÖR UPPGIFTEN ---
+    print_info(f"Startar Speldesigner-agenten ({llm_mode} LLM)...")
+    # Claude-anropet är synkront; kör i en tråd så att tidsgränsen kan slå till
+    try:
+        result = await asyncio.wait_for(
+            asyncio.to_thread(asyncio.run, speldesigner.create_ux_specification(feature_request)),
+            timeout=SPEC_TIMEOUT_SEC,
+        )
+    except asyncio.TimeoutError:
+        pytest.fail(f"Speldesignern överskred tidsgränsen ({SPEC_TIMEOUT_SEC} s)")
 
-    # --- STEG 4: VERIFIERA RESULTATET ---
+    # --- STEG 3: VERIFIERA RESULTATET ---
     print_section("Resultat av Speldesigner-test")
-    print_info(f"Agentens slutrapport: {result}")
-
-    if spec_file_path.exists() and spec_file_path.stat().st_size > 0:
-        print_success(f"Specifikationsfilen skapades korrekt på: {spec_file_path}")
-        spec_content = read_file(str(spec_file_path), agent_name="test_runner")
-        print_info("--- Start på specifikationsfil ---")
-        print(spec_content[:1000] + "...")
-        print("--- Slut på specifikationsfil ---")
-    else:
-        print(f"❌ FEL: Specifikationsfilen '{spec_file_path}' skapades inte eller är tom.")
-
-async def main():
-    await test_speldesigner_specification_task()
-
-if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    assert "error" not in result, result.get("error")
+    assert result["story_id"] == SPEC_STORY_ID
+    assert result["file_saved"], f"Specifikationen sparades inte: {result['file_path']}"
+
+    # write_file svarar "✅ File written successfully: <relativ sökväg>"
+    spec_path = result["file_path"].split(": ", 1)[1]
+    assert spec_path.startswith(f"docs/specs/spec-{SPEC_STORY_ID}-")
+    spec_content = spec_backend.read(file_utils.PROJECT_ROOT / spec_path)
+    assert spec_content == result["specification_content"]
+    print_success(f"Specifikationen sparades på: {spec_path}")
+    print_info("--- Start på specifikationsfil ---")
+    print(spec_content[:1000] + "...")
+    print("--- Slut på specifikationsfil ---")
+
+    # Kriterierna ska vara just specifikationens checkboxar, inte agentens reservlista
+    assert result["acceptance_criteria"], "Specifikationen saknar acceptanskriterier"
+    for criterion in result["acceptance_criteria"]:
+        assert f"- [ ] {criterion}" in spec_content
+
+    if llm_mode == "mock":
+        assert result["acceptance_criteria"] == [
+            "Progress bar shows completion percentage for Anna",
+            "Interface loads within 2 seconds",
+        ]
+        assert "✅ References target user Anna" in result["validation_results"]["validation_notes"]
+
+        # Feature och analys skickas som human-meddelande efter systemprompten
+        (messages,), _ = speldesigner.claude_llm.invoke.call_args
+        assert messages[0] == ("system", speldesigner.get_system_prompt())
+        assert MOCK_GITHUB_ISSUE["title"] in messages[1][1]
+        assert analysis_json in messages[1][1]
+
+# Körs med (de riktiga LLM-varianterna hoppas över med --no-llm):
+# pytest tests/test_agents/test_speldesigner.py -v -s
+
+
+async def test_system_prompt_built_once_and_sent_as_system_message(speldesigner, mem_fs, monkeypatch):
+    """
+    Systemprompten (DNA-kontexten) formateras en gång per agent och skickas som
+    system-meddelande; bara featuren varierar i human-meddelandet.
+    """
+    import agents.speldesigner as speldesigner_module
+
+    class CountingTemplate(str):
+        format_calls = 0
+
+        def format(self, *args, **kwargs):
+            CountingTemplate.format_calls += 1
+            return super().format(*args, **kwargs)
+
+    template = speldesigner_module.SPEC_SYSTEM_PROMPT_TEMPLATE
+    monkeypatch.setattr(speldesigner_module, "SPEC_SYSTEM_PROMPT_TEMPLATE", CountingTemplate(template))
+    llm = MagicMock()
+    llm.invoke.return_value = SimpleNamespace(content=FAKE_SPEC)
+    monkeypatch.setattr(speldesigner, "claude_llm", llm)
+    for cached in ("_design_principles", "_target_audience", "_system_prompt"):
+        monkeypatch.setattr(speldesigner, cached, None)
+
+    for number in (1, 2):
+        result = await speldesigner.create_ux_specification(
+            {"title": f"Feature {number}", "body": f"Beskrivning {number}", "story_id": f"F{number}"}
+        )
+        assert "error" not in result, result.get("error")
+    assert CountingTemplate.format_calls == 1
+
+    system_prompt = template.format(
+        design_principles=speldesigner.get_design_principles(),
+        target_audience=speldesigner.get_target_audience()
+    )
+    assert [c.args[0] for c in llm.invoke.call_args_list] == [
+        [("system", system_prompt), ("human", "FEATURE TITLE: Feature 1\nFEATURE DESCRIPTION: Beskrivning 1")],
+        [("system", system_prompt), ("human", "FEATURE TITLE: Feature 2\nFEATURE DESCRIPTION: Beskrivning 2")],
+    ]
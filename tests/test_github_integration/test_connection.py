@@ -4,33 +4,33 @@ GitHub Integration Connection Tests
 ==================================
 
 Tests for verifying GitHub API connection and basic functionality.
+
+The GitHub mocks are built once per module and shared by the tests that
+use them; patched_github resets their recorded calls before each test.
+Because that state is per module, shard with pytest -n auto --dist=loadfile
+so the whole file runs on one worker.
 """
 
 import sys
 import pytest
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+from config.settings import GITHUB_CONFIG
+
+# Imported once per (xdist worker) process; the tests patch its attributes
+from workflows.github_integration import ProjectOwnerCommunication
+from workflows.github_integration.project_owner_communication import GitHubIntegration
 
 
 def test_github_integration_import():
     """Test that we can import GitHub integration modules."""
-    # This should not raise any ImportError
-    from workflows.github_integration.project_owner_communication import GitHubIntegration
-    from workflows.github_integration import ProjectOwnerCommunication
-    
-    # Assertions for pytest
+    # The module-level imports above would have raised ImportError already
     assert GitHubIntegration is not None
     assert ProjectOwnerCommunication is not None
 
 
 def test_github_connection_with_invalid_token():
     """Test GitHub API connection with invalid/missing token - should handle gracefully."""
-    from workflows.github_integration.project_owner_communication import GitHubIntegration
-    
     # We expect this to fail with 401 or configuration error
     with pytest.raises((ValueError, Exception)) as exc_info:
         GitHubIntegration()
@@ -42,105 +42,80 @@ def test_github_connection_with_invalid_token():
             "not configured" in error_msg)
 
 
-@patch('workflows.github_integration.project_owner_communication.SECRETS')
-@patch('workflows.github_integration.project_owner_communication.Github')
-@patch('workflows.github_integration.project_owner_communication.Auth')
-def test_github_mock_connection(mock_auth_class, mock_github_class, mock_secrets):
-    """Test GitHub integration with mocked connection."""
+MODULE = 'workflows.github_integration.project_owner_communication'
+
+
+@pytest.fixture(scope="module")
+def github_mocks():
+    """
+    Mock graph for SECRETS, Auth and Github, built once per module.
+    Returns (mock_auth_class, mock_github_class, mock_secrets, mock_repo).
+    """
     # Mock the secrets
+    mock_secrets = MagicMock()
     mock_secrets.get.return_value = 'mock_valid_token'
     
     # Mock the Auth.Token
-    mock_auth_token = MagicMock()
-    mock_auth_class.Token.return_value = mock_auth_token
+    mock_auth_class = MagicMock()
+    mock_auth_class.Token.return_value = MagicMock()
     
     # Mock the GitHub API
     mock_repo = MagicMock()
     mock_repo.owner = "jhonnyo88"
     mock_repo.name = "multi-agent-setup"
     
-    mock_github_instance = MagicMock()
-    mock_github_instance.get_repo.return_value = mock_repo
-    mock_github_class.return_value = mock_github_instance
+    mock_github_class = MagicMock()
+    mock_github_class.return_value.get_repo.return_value = mock_repo
     
-    # Import and test
-    from workflows.github_integration.project_owner_communication import GitHubIntegration
+    return mock_auth_class, mock_github_class, mock_secrets, mock_repo
+
+
+@pytest.fixture
+def patched_github(github_mocks):
+    """
+    Patch the module-scoped mocks into project_owner_communication for one
+    test. reset_mock() clears the recorded calls but keeps the configured
+    return values, so the mocks are reused rather than rebuilt.
+    """
+    mock_auth_class, mock_github_class, mock_secrets, _ = github_mocks
+    for mock in github_mocks:
+        mock.reset_mock()
+    
+    with patch(f'{MODULE}.SECRETS', mock_secrets), \
+         patch(f'{MODULE}.Github', mock_github_class), \
+         patch(f'{MODULE}.Auth', mock_auth_class):
+        yield github_mocks
+
+
+@pytest.mark.parametrize("cls, integration_of", [
+    (GitHubIntegration, lambda instance: instance),
+    (ProjectOwnerCommunication, lambda instance: instance.github),
+], ids=["github_integration", "project_owner_communication"])
+def test_github_mock_connection(patched_github, cls, integration_of):
+    """Test the GitHub classes with a mocked connection."""
+    mock_auth_class, mock_github_class, _, mock_repo = patched_github
+    mock_auth_token = mock_auth_class.Token.return_value
     
     # This should work with mocked dependencies
-    gh_integration = GitHubIntegration()
+    instance = cls()
+    github_integration = integration_of(instance)
     
     # Assertions
-    assert gh_integration is not None
-    assert gh_integration.repo_owner == "jhonnyo88"
-    assert gh_integration.repo_name == "multi-agent-setup"
-    assert gh_integration.github == mock_github_instance
+    assert github_integration.github is mock_github_class.return_value
+    assert github_integration.ai_repo_config == GITHUB_CONFIG["ai_team_repo"]
+    assert github_integration.project_repo_config == GITHUB_CONFIG["project_repo"]
+    assert github_integration.ai_repo is mock_repo
+    assert github_integration.project_repo is mock_repo
+    if cls is ProjectOwnerCommunication:
+        assert instance.status_handler is not None
     
     # Verify the Auth.Token was created with correct token
     mock_auth_class.Token.assert_called_once_with('mock_valid_token')
     
     # Verify the GitHub class was called with the auth object
-    mock_github_class.assert_called_once_with(auth=mock_auth_token)
-
-
-# Integration test function for manual running
-def run_manual_tests():
-    """Run tests manually with detailed output (for debugging)."""
-    print("🧪 Running Manual GitHub Integration Tests...")
-    print("=" * 60)
-    
-    tests_passed = 0
-    tests_total = 0
-    
-    # Test 1: Import test
-    print("\n🔍 Test 1: Import Test")
-    try:
-        test_github_integration_import()
-        print("   ✅ PASS - All imports successful")
-        tests_passed += 1
-    except Exception as e:
-        print(f"   ❌ FAIL - {e}")
-    tests_total += 1
-    
-    # Test 2: Connection test (expecting failure)
-    print("\n🔍 Test 2: Connection Test (expecting auth failure)")
-    try:
-        test_github_connection_with_invalid_token()
-        print("   ✅ PASS - Authentication error handled correctly")
-        tests_passed += 1
-    except Exception as e:
-        print(f"   ❌ FAIL - {e}")
-    tests_total += 1
-    
-    # Test 3: Mock test
-    print("\n🔍 Test 3: Mock Connection Test")
-    try:
-        with patch('workflows.github_integration.project_owner_communication.SECRETS') as mock_secrets, \
-            patch('workflows.github_integration.project_owner_communication.Github') as mock_github, \
-            patch('workflows.github_integration.project_owner_communication.Auth') as mock_auth:
-            
-            mock_secrets.get.return_value = 'mock_token'
-            mock_auth_token = MagicMock()
-            mock_auth.Token.return_value = mock_auth_token
-            mock_repo = MagicMock()
-            mock_github.return_value.get_repo.return_value = mock_repo
-            
-            from workflows.github_integration.project_owner_communication import GitHubIntegration
-            gh = GitHubIntegration()
-            
-            assert gh is not None
-            print("   ✅ PASS - Mock connection successful")
-            tests_passed += 1
-    except Exception as e:
-        print(f"   ❌ FAIL - {e}")
-    tests_total += 1
-    
-    print("\n" + "=" * 60)
-    print(f"📊 Results: {tests_passed}/{tests_total} tests passed")
-    
-    return tests_passed == tests_total
+    assert mock_github_class.call_args.kwargs["auth"] is mock_auth_token
 
 
 if __name__ == "__main__":
-    # When run directly, use manual test runner
-    success = run_manual_tests()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    # When run directly, hand over to pytest (verbose, output not captured)
+    sys.exit(pytest.main([__file__, "-v", "-s"]))
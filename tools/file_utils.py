@@ -14,15 +14,77 @@ ADAPTATION GUIDE:
 """
 
 import os
+import stat
 import json
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Protocol
 from datetime import datetime
 
 # Project configuration
 PROJECT_ROOT = Path(__file__).parent.parent
 ALLOWED_READ_PATHS = ["docs/", "config/", "agents/", "workflows/", "tools/"]
 ALLOWED_WRITE_PATHS = ["docs/specs/", "reports/", "backend/", "frontend/"]
+WRITE_BUFFER_SIZE = 64 * 1024
+
+class FileSystem(Protocol):
+    """Storage backend used by read_file, write_file and stat_file."""
+    
+    def read(self, path: Path) -> str: ...
+    def write(self, path: Path, content: str) -> None: ...
+    def exists(self, path: Path) -> bool: ...
+    def size(self, path: Path) -> int: ...  # raises OSError unless a regular file
+
+class RealFileSystem:
+    """Default backend: the local disk."""
+    
+    def read(self, path: Path) -> str:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    def write(self, path: Path, content: str) -> None:
+        # Create directory if needed
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Write file (64 KB buffer so large specs/code go out in few syscalls)
+        with open(path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(content)
+    
+    def exists(self, path: Path) -> bool:
+        return path.exists()
+    
+    def size(self, path: Path) -> int:
+        # One stat call, no file content loaded into memory
+        st = os.stat(path)
+        if not stat.S_ISREG(st.st_mode):
+            raise IsADirectoryError(str(path))
+        return st.st_size
+
+class InMemoryFileSystem:
+    """
+    Dict-backed backend for tests: no syscalls, nothing left on disk.
+    Directories are implicit, as with write_file's mkdir.
+    """
+    
+    def __init__(self, files: Optional[Dict[str, str]] = None):
+        self.files: Dict[Path, str] = {Path(p): c for p, c in (files or {}).items()}
+    
+    def read(self, path: Path) -> str:
+        try:
+            return self.files[Path(path)]
+        except KeyError:
+            raise FileNotFoundError(str(path)) from None
+    
+    def write(self, path: Path, content: str) -> None:
+        self.files[Path(path)] = content
+    
+    def exists(self, path: Path) -> bool:
+        return Path(path) in self.files
+    
+    def size(self, path: Path) -> int:
+        return len(self.read(path).encode('utf-8'))
+
+# Active backend; tests swap it (e.g. monkeypatch.setattr(file_utils, "_FS", InMemoryFileSystem()))
+_FS: FileSystem = RealFileSystem()
 
 def read_file(file_path: str) -> str:
     """
@@ -46,11 +108,10 @@ def read_file(file_path: str) -> str:
             return f"❌ Path not allowed for reading: {file_path}"
         
         # Read file
-        if not full_path.exists():
+        if not _FS.exists(full_path):
             return f"❌ File not found: {file_path}"
             
-        with open(full_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = _FS.read(full_path)
         
         print(f"✅ Read file: {file_path}")
         return content
@@ -58,6 +119,25 @@ def read_file(file_path: str) -> str:
     except Exception as e:
         return f"❌ Error reading {file_path}: {str(e)}"
 
+def stat_file(file_path: str) -> Tuple[bool, int]:
+    """
+    Check that a readable file exists and get its size without reading it.
+    
+    Args:
+        file_path: Path to file (relative to project root)
+        
+    Returns:
+        (exists, size_bytes) - (False, 0) if missing, not a regular file or not allowed
+    """
+    if not _is_safe_read_path(file_path):
+        return False, 0
+    
+    full_path = Path(file_path) if Path(file_path).is_absolute() else PROJECT_ROOT / file_path
+    try:
+        return True, _FS.size(full_path)
+    except OSError:
+        return False, 0
+
 def write_file(file_path: str, content: str) -> str:
     """
     Simple file writing with basic validation.
@@ -80,12 +160,7 @@ def write_file(file_path: str, content: str) -> str:
         if not _is_safe_write_path(file_path):
             return f"❌ Path not allowed for writing: {file_path}"
         
-        # Create directory if needed
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Write file
-        with open(full_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        _FS.write(full_path, content)
         
         print(f"✅ Wrote file: {file_path}")
         return f"✅ File written successfully: {file_path}"
@@ -111,20 +186,22 @@ def list_files(directory_path: str, extension: Optional[str] = None) -> List[str
         else:
             full_path = Path(directory_path)
         
-        if not full_path.exists() or not full_path.is_dir():
+        if not full_path.is_dir():
             return []
         
         files = []
-        for item in full_path.iterdir():
-            if item.is_file():
-                if extension is None or item.suffix.lower() == extension.lower():
-                    # Return path relative to project root
-                    try:
-                        rel_path = item.relative_to(PROJECT_ROOT)
-                        files.append(str(rel_path).replace('\\', '/'))
-                    except ValueError:
-                        # File outside project root
-                        continue
+        # scandir's DirEntry answers is_file() from the directory listing (no stat per entry)
+        with os.scandir(full_path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    if extension is None or os.path.splitext(entry.name)[1].lower() == extension.lower():
+                        # Return path relative to project root
+                        try:
+                            rel_path = Path(entry.path).relative_to(PROJECT_ROOT)
+                            files.append(str(rel_path).replace('\\', '/'))
+                        except ValueError:
+                            # File outside project root
+                            continue
         
         return sorted(files)
         
@@ -187,35 +264,39 @@ def get_project_structure(max_depth: int = 2) -> str:
     """Get overview of project structure."""
     structure = []
     
-    def add_directory(path: Path, prefix: str = "", depth: int = 0):
+    def add_directory(path: str, prefix: str = "", depth: int = 0):
         if depth >= max_depth:
             return
         
         try:
-            items = sorted(path.iterdir(), key=lambda x: (x.is_file(), x.name.lower()))
+            # DirEntry caches its type from the listing, so sorting and the
+            # is_dir() checks below need no stat call per entry
+            with os.scandir(path) as entries:
+                items = sorted(entries, key=lambda x: (x.is_file(), x.name.lower()))
+            last_index = sum(1 for x in items if not x.name.startswith('.')) - 1
             
             for i, item in enumerate(items):
-                # Skip hidden files and common ignored directories
+                # Skip hidden files and common ignored directories (before descending)
                 if item.name.startswith('.') or item.name in ['__pycache__', 'node_modules']:
                     continue
                 
-                is_last = i == len([x for x in items if not x.name.startswith('.')]) - 1
+                is_last = i == last_index
                 current_prefix = "└── " if is_last else "├── "
                 
                 if item.is_dir():
                     structure.append(f"{prefix}{current_prefix}📁 {item.name}/")
                     next_prefix = prefix + ("    " if is_last else "│   ")
-                    add_directory(item, next_prefix, depth + 1)
+                    add_directory(item.path, next_prefix, depth + 1)
                 else:
                     # Only show important file types
-                    if item.suffix in ['.py', '.md', '.json', '.yml', '.toml', '.txt']:
+                    if os.path.splitext(item.name)[1] in ['.py', '.md', '.json', '.yml', '.toml', '.txt']:
                         structure.append(f"{prefix}{current_prefix}📄 {item.name}")
         
         except PermissionError:
             structure.append(f"{prefix}❌ Permission denied")
     
     structure.append(f"📁 {PROJECT_ROOT.name}/ (Project Root)")
-    add_directory(PROJECT_ROOT)
+    add_directory(str(PROJECT_ROOT))
     
     return "\n".join(structure)
 
@@ -25,6 +25,22 @@ import re
 import asyncio
 from datetime import datetime
 
+# Dependency keywords; each is followed by one or more issue numbers ("#12, #13")
+DEPENDENCY_KEYWORDS = (
+    r'depends?\s+on',
+    r'blocked\s+by',
+    r'dependencies?',
+    r'requires?',
+    r'must\s+complete',
+    r'needs?'
+)
+# All keywords in one compiled alternation, so the issue body is scanned once (case insensitive)
+DEPENDENCY_RE = re.compile(
+    r'(?:' + '|'.join(DEPENDENCY_KEYWORDS) + r')[:\s]+[#\s]*(\d+(?:\s*,\s*#?\s*\d+)*)',
+    re.IGNORECASE | re.MULTILINE
+)
+ISSUE_NUMBER_RE = re.compile(r'\d+')
+
 class Priority(Enum):
     """Priority levels for GitHub Issues"""
     P0_CRITICAL = 0    # Security fixes, system-critical issues
@@ -135,24 +151,12 @@ class PriorityQueueManager:
         if not issue_body:
             return []
         
-        # Dependency extraction patterns (case insensitive)
-        dependency_patterns = [
-            r'depends?\s+on[:\s]+[#\s]*(\d+(?:\s*,\s*#?\s*\d+)*)',
-            r'blocked\s+by[:\s]+[#\s]*(\d+(?:\s*,\s*#?\s*\d+)*)',
-            r'dependencies?[:\s]+[#\s]*(\d+(?:\s*,\s*#?\s*\d+)*)',
-            r'requires?[:\s]+[#\s]*(\d+(?:\s*,\s*#?\s*\d+)*)',
-            r'must\s+complete[:\s]+[#\s]*(\d+(?:\s*,\s*#?\s*\d+)*)',
-            r'needs?[:\s]+[#\s]*(\d+(?:\s*,\s*#?\s*\d+)*)'
-        ]
-        
         dependencies = []
         
-        for pattern in dependency_patterns:
-            matches = re.findall(pattern, issue_body, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                # Extract all numbers from the match string
-                numbers = re.findall(r'\d+', match)
-                dependencies.extend([int(num) for num in numbers])
+        for match in DEPENDENCY_RE.findall(issue_body):
+            # Extract all numbers from the match string
+            numbers = ISSUE_NUMBER_RE.findall(match)
+            dependencies.extend([int(num) for num in numbers])
         
         # Remove duplicates and return
         return list(set(dependencies))